@@ -1,53 +1,312 @@
 import aiohttp
 import asyncio
+import functools
+import itertools
 import json
-from typing import List, Dict, Optional
+import logging
+from typing import Callable, List, Dict, Iterable, Iterator, Optional, Sequence, Tuple
 import sys
 import os
+import threading
 from tabulate import tabulate  # For table formatting
 import re  # For regular expressions
+import time
+
+try:
+    import orjson  # Faster JSON encoding/decoding when available
+except ImportError:
+    orjson = None
+
+try:
+    import readline  # Line editing and history for input(); pyreadline3 on Windows
+except ImportError:
+    readline = None
+
+try:
+    # Display width of wide characters, measured the same way tabulate does
+    from wcwidth import wcswidth as _text_width
+except ImportError:
+    _text_width = len
+
+try:
+    import termios  # Terminal mode save/restore; not available on Windows
+except ImportError:
+    termios = None
+
+logger = logging.getLogger(__name__)
+
+USERS_URL = "https://jsonplaceholder.typicode.com/users"
+CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "task3")
+CACHE_FILE = os.path.join(CACHE_DIR, "users.json")
+CACHE_TTL = 3600  # Seconds before the cached users are refetched
+HISTORY_FILE = os.path.join(CACHE_DIR, "history")
+HISTORY_LENGTH = 500
+
+# False when the terminal cannot handle ANSI escapes (legacy Windows console)
+_ansi_clear = True
+
+# (name, email, street, city) as shown by the display functions
+UserRow = Tuple[str, str, str, str]
+
+# Shared HTTP session, created on first use and closed when main() exits
+_session: Optional[aiohttp.ClientSession] = None
+
+def enable_ansi_terminal() -> None:
+    """
+    Turn on ANSI escape handling for the Windows console so clear_screen can
+    avoid spawning 'cls'; legacy consoles keep using 'cls'
+    """
+    global _ansi_clear
+    if os.name != 'nt':
+        return
+    try:
+        import ctypes
+        kernel32 = ctypes.windll.kernel32
+        handle = kernel32.GetStdHandle(-11)  # STD_OUTPUT_HANDLE
+        mode = ctypes.c_uint32()
+        if not kernel32.GetConsoleMode(handle, ctypes.byref(mode)):
+            raise OSError("GetConsoleMode failed")
+        # ENABLE_VIRTUAL_TERMINAL_PROCESSING
+        if not kernel32.SetConsoleMode(handle, mode.value | 0x0004):
+            raise OSError("SetConsoleMode failed")
+    except (AttributeError, OSError):
+        _ansi_clear = False
 
 def clear_screen() -> None:
     """Clear the terminal screen for both Windows and Unix-like systems"""
-    os.system('cls' if os.name == 'nt' else 'clear')
+    if _ansi_clear:
+        # Clear screen and move the cursor home without starting a subprocess
+        sys.stdout.write("\x1b[2J\x1b[H")
+        sys.stdout.flush()
+    else:
+        os.system('cls')
+
+def load_cached_users() -> Optional[List[Dict]]:
+    """
+    Return users from the on-disk cache if it exists and is still fresh
+    """
+    try:
+        if time.time() - os.path.getmtime(CACHE_FILE) > CACHE_TTL:
+            return None
+        with open(CACHE_FILE, encoding="utf-8") as f:
+            cached = json.load(f)
+    except (OSError, ValueError):
+        # Missing, unreadable or corrupt cache - treat as a miss
+        return None
+
+    if not isinstance(cached, dict) or cached.get("url") != USERS_URL or not isinstance(cached.get("users"), list):
+        return None
+    return cached["users"]
 
-async def fetch_users() -> Optional[List[Dict]]:
+def save_cached_users(users: List[Dict]) -> None:
+    """
+    Write users to the on-disk cache; failures are ignored
     """
-    Asynchronously fetch users from the API with comprehensive error handling
+    try:
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        tmp_file = CACHE_FILE + ".tmp"
+        with open(tmp_file, "w", encoding="utf-8") as f:
+            json.dump({"url": USERS_URL, "users": users}, f)
+        os.replace(tmp_file, CACHE_FILE)
+    except (OSError, TypeError, ValueError):
+        pass
+
+def load_history() -> None:
     """
-    url = "https://jsonplaceholder.typicode.com/users"
-    timeout = aiohttp.ClientTimeout(total=10)  # 10 seconds timeout
+    Load previously entered menu choices and patterns into readline
+    """
+    if readline is None:
+        return
+    readline.set_history_length(HISTORY_LENGTH)
+    try:
+        readline.read_history_file(HISTORY_FILE)
+    except OSError:
+        pass
+
+def save_history() -> None:
+    """
+    Persist the readline history for the next run; failures are ignored
+    """
+    if readline is None:
+        return
+    try:
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        readline.write_history_file(HISTORY_FILE)
+    except OSError:
+        pass
+
+def save_terminal() -> Optional[list]:
+    """
+    Return the terminal attributes of stdin so they can be restored on exit,
+    or None when stdin is not a terminal
+    """
+    if termios is None or not sys.stdin.isatty():
+        return None
+    try:
+        return termios.tcgetattr(sys.stdin.fileno())
+    except termios.error:
+        return None
+
+def restore_terminal(attrs: Optional[list]) -> None:
+    """
+    Put the terminal back in the mode saved by save_terminal. A prompt that
+    is abandoned on Ctrl+C leaves readline's raw mode (no echo) behind.
+    """
+    if attrs is None:
+        return
+    try:
+        termios.tcsetattr(sys.stdin.fileno(), termios.TCSADRAIN, attrs)
+    except termios.error:
+        pass
+
+async def _get_session() -> aiohttp.ClientSession:
+    """
+    Return the shared HTTP session, creating it on first use
+    """
+    global _session
+    if _session is None or _session.closed:
+        timeout = aiohttp.ClientTimeout(total=10)  # 10 seconds timeout
+        # Keep resolved addresses for 5 minutes so warm requests skip DNS
+        connector = aiohttp.TCPConnector(
+            limit=50,
+            use_dns_cache=True,
+            ttl_dns_cache=300,
+            enable_cleanup_closed=True,
+        )
+        _session = aiohttp.ClientSession(timeout=timeout, connector=connector)
+    return _session
+
+async def close_session() -> None:
+    """
+    Close the shared HTTP session if one was opened
+    """
+    global _session
+    if _session is not None and not _session.closed:
+        await _session.close()
+    _session = None
+
+class FetchError(Exception):
+    """Raised by fetch_users with a message suitable for showing the user"""
+
+async def fetch_users() -> List[Dict]:
+    """
+    Asynchronously fetch users from the API with comprehensive error handling.
+    A fresh on-disk copy is returned without touching the network. Failures
+    raise FetchError rather than printing, since this runs in the background
+    while the menu prompt is waiting for input.
+    """
+    cached_users = load_cached_users()
+    if cached_users is not None:
+        return cached_users
+
+    url = USERS_URL
     
     try:
-        async with aiohttp.ClientSession(timeout=timeout) as session:
-            async with session.get(url) as response:
-                # Check if the response status is OK (200)
-                response.raise_for_status()
-                
-                # Try to parse JSON response
-                return await response.json()
+        session = await _get_session()
+        async with session.get(url) as response:
+            # Check if the response status is OK (200)
+            response.raise_for_status()
+            
+            # Try to parse JSON response straight from the raw bytes
+            raw = await response.read()
+            users = orjson.loads(raw) if orjson is not None else json.loads(raw)
+            save_cached_users(users)
+            return users
                 
-    except aiohttp.ClientTimeout:
-        print("\nError: The request timed out. Please check your internet connection and try again.")
+    except asyncio.TimeoutError:
+        message = "The request timed out. Please check your internet connection and try again."
     except aiohttp.ClientConnectionError:
-        print("\nError: Could not connect to the server. Please check your internet connection.")
-    except aiohttp.ContentTypeError:
-        print("\nError: Received invalid JSON response from the server.")
+        message = "Could not connect to the server. Please check your internet connection."
+    except (aiohttp.ContentTypeError, json.JSONDecodeError):
+        message = "Received invalid JSON response from the server."
     except aiohttp.ClientResponseError as e:
         if e.status == 404:
-            print("\nError: The requested resource was not found.")
+            message = "The requested resource was not found."
         elif e.status == 403:
-            print("\nError: Access to the resource is forbidden.")
+            message = "Access to the resource is forbidden."
         else:
-            print(f"\nError: Server returned an error (Status code: {e.status})")
+            message = f"Server returned an error (Status code: {e.status})"
     except Exception as e:
-        print(f"\nAn unexpected error occurred: {str(e)}")
+        message = f"An unexpected error occurred: {str(e)}"
     
-    return None
+    raise FetchError(message)
+
+# Characters that give a search term regex meaning; terms without any of
+# them are matched with a plain substring check instead of the regex engine
+_REGEX_META = frozenset(r".^$*+?{}[]|()\\")
+
+# Patterns that match every name, including an empty one
+_MATCH_ALL = frozenset({".*", "^", "$", "^.*", ".*$", "^.*$"})
+
+# Optional " #N" suffix on a search term limiting it to the first N matches
+_LIMIT_SUFFIX = re.compile(r"^(.*?)\s+#(\d+)$")
+
+# Shown when a search term is not a valid regular expression
+_REGEX_TIPS = """Tips:
+- Use \\. to match a literal dot
+- Use \\* to match a literal asterisk
+- Use \\[ to match a literal square bracket
+- Add \\ before any special character to match it literally"""
+
+@functools.lru_cache(maxsize=128)
+def _compile_pattern(term: str) -> re.Pattern:
+    """
+    Compile a case-insensitive search pattern, cached for repeat searches
+    """
+    return re.compile(term, re.IGNORECASE)
 
-def filter_users_by_name(users: List[Dict], search_term: str) -> List[Dict]:
+def split_limit(search_term: str) -> Tuple[str, Optional[int]]:
     """
-    Filter users based on regular expression pattern (case-insensitive)
+    Split an optional trailing " #N" match limit off a search term,
+    e.g. "^A #5" -> ("^A", 5); a limit of 0, or one too large to slice
+    with, means no limit
+    """
+    match = _LIMIT_SUFFIX.match(search_term)
+    if not match:
+        return search_term, None
+    limit = int(match.group(2))
+    if limit == 0 or limit > sys.maxsize:
+        return match.group(1), None
+    return match.group(1), limit
+
+def iter_matching(users: Iterable[Dict], pattern: re.Pattern) -> Iterator[Dict]:
+    """Lazily yield users whose name matches pattern"""
+    # Bind the method once so the loop skips the attribute lookup
+    search = pattern.search
+    return (user for user in users if search(user['name']))
+
+def _report_matches(filtered_users: List[Dict], search_term: str, limit: Optional[int]) -> None:
+    """Print how many users matched the search term"""
+    if not filtered_users:
+        print(f"\nNo users found matching pattern '{search_term}' in their name.")
+    elif limit is not None and len(filtered_users) == limit:
+        print(f"\nShowing the first {limit} user(s) matching pattern '{search_term}' in their name.")
+    else:
+        print(f"\nFound {len(filtered_users)} user(s) matching pattern '{search_term}' in their name.")
+
+def _trace_matches(users: List[Dict], matches: Callable[[str], object]) -> None:
+    """Log which names matched; only built when debug logging is on (DEBUG=1)"""
+    if logger.isEnabledFor(logging.DEBUG):
+        trace = "\n".join(
+            f"  {'✓' if matches(user['name']) else '×'} '{user['name']}'"
+            for user in users
+        )
+        logger.debug("Matching names:\n%s", trace)
+
+def _filter_literal(users: List[Dict], text: str, limit: Optional[int]) -> List[Dict]:
+    """Case-insensitive plain substring search - much cheaper than a regex"""
+    print(f"\nUsing literal search pattern: {text}")
+    needle = text.lower()
+    matches = (user for user in users if needle in user['name'].lower())
+    filtered_users = list(itertools.islice(matches, limit))
+    _trace_matches(users, lambda name: needle in name.lower())
+    _report_matches(filtered_users, text, limit)
+    return filtered_users
+
+def filter_users_by_name(users: List[Dict], search_term: str, limit: Optional[int] = None) -> List[Dict]:
+    """
+    Filter users based on regular expression pattern (case-insensitive),
+    stopping once limit matches are found (all matches when limit is None)
     Examples:
         - "^A" will match names starting with A
         - "a$" will match names ending with a
@@ -60,138 +319,209 @@ def filter_users_by_name(users: List[Dict], search_term: str) -> List[Dict]:
     # Handle empty search term
     if not search_term or search_term.isspace():
         print("\nWarning: Empty search term - returning all users")
-        return users
+        return list(itertools.islice(users, limit))
+    
+    # Patterns that accept every name need no matching at all
+    if search_term in _MATCH_ALL:
+        print(f"\nPattern '{search_term}' matches every name - returning all users")
+        return list(itertools.islice(users, limit))
     
+    # A leading backslash asks for the rest of the term to be matched literally,
+    # and plain text needs no regex at all
+    if search_term.startswith('\\'):
+        return _filter_literal(users, search_term[1:], limit)
+    if _REGEX_META.isdisjoint(search_term):
+        return _filter_literal(users, search_term, limit)
+    
+    print(f"\nUsing regex pattern: {search_term}")
     try:
-        # Try to compile the regular expression pattern
-        try:
-            # Escape special characters if the pattern starts with a backslash
-            if search_term.startswith('\\'):
-                search_term = re.escape(search_term[1:])
-                print(f"\nUsing literal search pattern: {search_term}")
-            else:
-                print(f"\nUsing regex pattern: {search_term}")
-            
-            pattern = re.compile(search_term, re.IGNORECASE)
-            
-        except re.error as e:
-            print(f"\nInvalid regular expression: {str(e)}")
-            print("Tips:")
-            print("- Use \\. to match a literal dot")
-            print("- Use \\* to match a literal asterisk")
-            print("- Use \\[ to match a literal square bracket")
-            print("- Add \\ before any special character to match it literally")
-            print("\nFalling back to plain text search...")
-            # Fallback to plain text search if regex is invalid
-            pattern = re.compile(re.escape(search_term), re.IGNORECASE)
-        
-        # Perform the search with detailed error handling
+        pattern = _compile_pattern(search_term)
+    except re.error as e:
+        print(f"\nInvalid regular expression: {str(e)}")
+        print(_REGEX_TIPS)
+        print("\nFalling back to plain text search...")
+        return _filter_literal(users, search_term, limit)
+    
+    filtered_users = list(itertools.islice(iter_matching(users, pattern), limit))
+    
+    _trace_matches(users, pattern.search)
+    
+    # Provide feedback about the search results
+    _report_matches(filtered_users, search_term, limit)
+    return filtered_users
+
+def _sanitize(users: List[Dict]) -> List[Dict]:
+    """
+    Drop users missing any field the menu relies on, or holding a non-string
+    value in one, so the display code can use them without guarding every lookup
+    """
+    valid_users = []
+    for user in users:
         try:
-            filtered_users = []
-            print("\nDebug: Matching names:")
-            for user in users:
-                name = user['name']
-                if pattern.search(name):
-                    filtered_users.append(user)
-                    print(f"  ✓ '{name}' matches pattern")
-                else:
-                    print(f"  × '{name}' does not match pattern")
-            
-            # Provide feedback about the search results
-            if not filtered_users:
-                print(f"\nNo users found matching pattern '{search_term}' in their name.")
-            else:
-                print(f"\nFound {len(filtered_users)} user(s) matching pattern '{search_term}' in their name:")
-                for user in filtered_users:
-                    print(f"  - {user['name']}")
-                
-            return filtered_users
-            
-        except Exception as search_error:
-            print(f"\nError during pattern matching: {str(search_error)}")
-            print("Falling back to plain text search...")
-            # Ultimate fallback - plain text contains search
-            return [user for user in users if search_term.lower() in user['name'].lower()]
-            
-    except Exception as e:
-        print(f"\nUnexpected error while filtering users: {str(e)}")
-        print("Returning all users...")
-        return users
+            fields = (user['name'], user['email'], user['address']['street'], user['address']['city'])
+        except (KeyError, TypeError) as e:
+            logger.warning("Dropping malformed user (%s: %s): %r", type(e).__name__, e, user)
+            continue
+        if not all(isinstance(field, str) for field in fields):
+            logger.warning("Dropping malformed user (non-string field): %r", user)
+            continue
+        valid_users.append(user)
+    return valid_users
+
+def _flatten(users: List[Dict]) -> List[UserRow]:
+    """
+    Pull the displayed fields out of each (sanitized) user once so every
+    display format can reuse them
+    """
+    return [
+        (user['name'], user['email'], user['address']['street'], user['address']['city'])
+        for user in users
+    ]
 
-def display_users(users: Optional[List[Dict]]) -> None:
+def display_users(rows: List[UserRow]) -> None:
     """
-    Display user information with error handling
+    Display user information
     """
     clear_screen()
-    if not users:
+    if not rows:
         print("\nNo users found matching the search criteria.")
         return
     
-    try:
-        for user in users:
-            print(f"\nName: {user['name']}")
-            print(f"Email: {user['email']}")
-            print(f"Address: {user['address']['street']}, {user['address']['city']}")
-            print("-" * 50)
-        
-        # Add pause at the end of display
-        input("\nPress Enter to continue...")
-        clear_screen()
-    except KeyError as e:
-        print(f"\nError: Missing required field in user data: {str(e)}")
-    except Exception as e:
-        print(f"\nError while displaying users: {str(e)}")
+    # Build the whole listing first and write it in one go
+    separator = "-" * 50
+    lines = []
+    for name, email, street, city in rows:
+        lines.append(f"\nName: {name}")
+        lines.append(f"Email: {email}")
+        lines.append(f"Address: {street}, {city}")
+        lines.append(separator)
+    sys.stdout.write("\n".join(lines) + "\n")
+    
+    # Add pause at the end of display
+    input("\nPress Enter to continue...")
+    clear_screen()
 
 def display_users_json(users: List[Dict]) -> None:
     """Display users in JSON format"""
     clear_screen()
     try:
-        formatted_json = json.dumps(users, indent=2)
-        print("\nUsers in JSON format:")
-        print(formatted_json)
+        if orjson is not None:
+            formatted_json = orjson.dumps(users, option=orjson.OPT_INDENT_2).decode()
+        else:
+            formatted_json = json.dumps(users, indent=2)
+        sys.stdout.write("\nUsers in JSON format:\n" + formatted_json + "\n")
         input("\nPress Enter to continue...")
         clear_screen()
     except Exception as e:
         print(f"\nError formatting JSON: {str(e)}")
 
-def display_users_table(users: List[Dict]) -> None:
+# Cells containing any of these are rendered by tabulate instead of _fast_grid
+_CONTROL_CHARS = re.compile(r"[\x00-\x1f\x7f-\x9f]")
+
+def _fast_grid(rows: Sequence[UserRow], headers: List[str]) -> str:
+    """
+    Render rows in the same layout as tabulate's "grid" format with number
+    parsing disabled: cells are stripped, left-aligned and sized by display
+    width. The columns are fixed, so one pass to size them is all that is needed.
+    Cells must not contain control characters (see _CONTROL_CHARS).
+    """
+    stripped_rows = [tuple(cell.strip() for cell in row) for row in rows]
+    # Like tabulate, headers get at least two spaces of padding
+    widths = [
+        max([_text_width(header) + 2, *(_text_width(row[i]) for row in stripped_rows)])
+        for i, header in enumerate(headers)
+    ]
+    separator = "+" + "+".join("-" * (w + 2) for w in widths) + "+"
+    header_separator = "+" + "+".join("=" * (w + 2) for w in widths) + "+"
+
+    def format_line(cells: Iterable[str]) -> str:
+        padded = (cell + " " * (w - _text_width(cell)) for cell, w in zip(cells, widths))
+        return "| " + " | ".join(padded) + " |"
+
+    lines = [separator, format_line(headers), header_separator]
+    for row in stripped_rows:
+        lines.append(format_line(row))
+        lines.append(separator)
+    if not stripped_rows:
+        lines.append(separator)
+    return "\n".join(lines)
+
+@functools.lru_cache(maxsize=4)
+def _render_table(rows: Tuple[UserRow, ...]) -> str:
+    """Render rows as a grid table, cached so format toggles skip re-rendering"""
+    headers = ["Name", "Email", "Street", "City"]
+    # Set USE_TABULATE=1 to render with tabulate, the reference implementation.
+    # It is also used for cells with newlines, tabs or ANSI codes, which it
+    # splits into multi-line rows or measures without the invisible codes.
+    has_control_chars = _CONTROL_CHARS.search("".join(itertools.chain.from_iterable(rows)))
+    if os.environ.get("USE_TABULATE") or has_control_chars:
+        return tabulate(rows, headers=headers, tablefmt="grid", disable_numparse=True)
+    return _fast_grid(rows, headers)
+
+def display_users_table(rows: List[UserRow]) -> None:
     """Display users in table format"""
     clear_screen()
     try:
-        # Prepare data for table
-        table_data = []
-        headers = ["Name", "Email", "Street", "City"]
-        
-        for user in users:
-            row = [
-                user['name'],
-                user['email'],
-                user['address']['street'],
-                user['address']['city']
-            ]
-            table_data.append(row)
-        
-        print("\nUsers in table format:")
-        print(tabulate(table_data, headers=headers, tablefmt="grid"))
+        table = _render_table(tuple(rows))
+        sys.stdout.write("\nUsers in table format:\n" + table + "\n")
         input("\nPress Enter to continue...")
         clear_screen()
     except Exception as e:
         print(f"\nError creating table: {str(e)}")
 
-def display_users_compact(users: List[Dict]) -> None:
+def display_users_compact(rows: List[UserRow]) -> None:
     """Display users in compact format"""
     clear_screen()
-    try:
-        print("\nUsers in compact format:")
-        for user in users:
-            print(f"{user['name']} | {user['email']} | {user['address']['street']}, {user['address']['city']}")
-        input("\nPress Enter to continue...")
-        clear_screen()
-    except Exception as e:
-        print(f"\nError displaying compact format: {str(e)}")
+    lines = ["\nUsers in compact format:"]
+    lines.extend(f"{name} | {email} | {street}, {city}" for name, email, street, city in rows)
+    sys.stdout.write("\n".join(lines) + "\n")
+    input("\nPress Enter to continue...")
+    clear_screen()
+
+def _forget_input(line: str) -> None:
+    """
+    Drop a just-entered line from the readline history, so menu choices do not
+    bury the search patterns that Up arrow should recall
+    """
+    if readline is None or not line:
+        return
+    length = readline.get_current_history_length()
+    if length and readline.get_history_item(length) == line:
+        readline.remove_history_item(length - 1)
 
-def choose_display_format(users: List[Dict]) -> None:
-    """Choose and apply display format for users"""
+async def _ainput(prompt: str = "", remember: bool = False) -> str:
+    """
+    Read a line of input without blocking the event loop. The read runs in a
+    daemon thread so Ctrl+C can still exit while a prompt is waiting; main()
+    restores the terminal mode the abandoned read leaves behind. Only lines
+    read with remember=True are kept in the history.
+    """
+    loop = asyncio.get_running_loop()
+    future = loop.create_future()
+
+    def deliver(setter, value) -> None:
+        if not future.done():
+            setter(value)
+
+    def read_line() -> None:
+        try:
+            line = input(prompt)
+            if not remember:
+                _forget_input(line)
+        except Exception as e:
+            outcome = (future.set_exception, e)
+        else:
+            outcome = (future.set_result, line)
+        try:
+            loop.call_soon_threadsafe(deliver, *outcome)
+        except RuntimeError:
+            pass  # Event loop already closed
+
+    threading.Thread(target=read_line, daemon=True).start()
+    return await future
+
+def choose_display_format(users: List[Dict], rows: List[UserRow]) -> None:
+    """Choose and apply display format for users (rows are the flattened users)"""
     while True:
         clear_screen()
         print("\nChoose display format:")
@@ -201,16 +531,18 @@ def choose_display_format(users: List[Dict]) -> None:
         print("4. Compact format")
         print("5. Back to main menu")
         
-        choice = input("\nEnter your choice (1-5): ").strip()
+        choice = input("\nEnter your choice (1-5): ")
+        _forget_input(choice)
+        choice = choice.strip()
         
         if choice == "1":
-            display_users(users)
+            display_users(rows)
         elif choice == "2":
             display_users_json(users)
         elif choice == "3":
-            display_users_table(users)
+            display_users_table(rows)
         elif choice == "4":
-            display_users_compact(users)
+            display_users_compact(rows)
         elif choice == "5":
             clear_screen()
             break
@@ -222,14 +554,32 @@ async def main() -> None:
     """
     Main program loop with error handling
     """
-    # Fetch all users
+    terminal_attrs = save_terminal()
+    load_history()
+    # Start fetching right away so the network round-trip overlaps the menu
+    fetch_task = asyncio.create_task(fetch_users())
+    try:
+        await run_menu(fetch_task)
+    finally:
+        if fetch_task.done() and not fetch_task.cancelled():
+            # Mark a failure the menu never awaited as handled, so asyncio
+            # does not log it as an unretrieved task exception
+            fetch_task.exception()
+        else:
+            fetch_task.cancel()
+        save_history()
+        await close_session()
+        restore_terminal(terminal_attrs)
+
+async def run_menu(fetch_task: "asyncio.Task[List[Dict]]") -> None:
+    """
+    Run the interactive menu; users are awaited from fetch_task the first
+    time a menu choice needs them
+    """
     clear_screen()
     print("\nFetching users from the API...")
-    users = await fetch_users()
-    
-    if users is None:
-        print("\nCould not fetch user data. Please try again later.")
-        return
+    users: Optional[List[Dict]] = None
+    rows: List[UserRow] = []
     
     while True:
         try:
@@ -240,12 +590,22 @@ async def main() -> None:
             print("3. Change display format")
             print("4. Exit")
             
-            choice = input("\nEnter your choice (1-4): ").strip()
+            choice = (await _ainput("\nEnter your choice (1-4): ")).strip()
             
+            # Wait for the background fetch only once the data is needed
+            if users is None and choice in ("1", "2", "3"):
+                try:
+                    users = await fetch_task
+                except FetchError as e:
+                    print(f"\nError: {str(e)}")
+                    print("\nCould not fetch user data. Please try again later.")
+                    return
+                users = _sanitize(users)
+                rows = _flatten(users)
             
             if choice == "1":
                 print("\nShowing all users:")
-                display_users(users)
+                display_users(rows)
             
             elif choice == "2":
                 clear_screen()
@@ -255,6 +615,7 @@ async def main() -> None:
                 print("  .*son.*   - names containing 'son'")
                 print("  [AM].*    - names starting with A or M")
                 print("  \\bJohn\\b - match whole word 'John'")
+                print("  ^A #2     - only the first 2 names starting with A")
                 print("\nSpecial Characters:")
                 print("  Add \\ before . * + ? ^ $ [ ] ( ) { } | \\ to match them literally")
                 print("  Example: \\. matches literal dot, \\* matches literal asterisk")
@@ -262,20 +623,21 @@ async def main() -> None:
                 for user in users:
                     print(f"  - {user['name']}")
                 
-                search_term = input("\nEnter a regex pattern to search for (or '\\' + text for literal search): ").strip()
+                search_term = (await _ainput("\nEnter a regex pattern to search for (or '\\' + text for literal search): ", remember=True)).strip()
                 if not search_term:
                     print("\nEmpty search term - showing all users")
-                    display_users(users)
+                    display_users(rows)
                     continue
                     
                 #clear_screen()
-                filtered_users = filter_users_by_name(users, search_term)
+                search_term, limit = split_limit(search_term)
+                filtered_users = filter_users_by_name(users, search_term, limit)
                 if filtered_users:  # Only show users if we found any
                     print(f"\nShowing users matching pattern '{search_term}':")
-                    display_users(filtered_users)
+                    display_users(_flatten(filtered_users))
             
             elif choice == "3":
-                choose_display_format(users)
+                choose_display_format(users, rows)
             
             elif choice == "4":
                 clear_screen()
@@ -284,7 +646,7 @@ async def main() -> None:
             
             else:
                 print("\nInvalid choice. Please enter 1-4.")
-                input("\nPress Enter to continue...")
+                await _ainput("\nPress Enter to continue...")
                 
         except KeyboardInterrupt:
             clear_screen()
@@ -293,13 +655,19 @@ async def main() -> None:
         except Exception as e:
             print(f"\nAn unexpected error occurred: {str(e)}")
             print("Please try again.")
-            input("\nPress Enter to continue...")
+            await _ainput("\nPress Enter to continue...")
 
 if __name__ == "__main__":
+    # Set DEBUG=1 to trace which names matched a search
+    logging.basicConfig(
+        level=logging.DEBUG if os.environ.get("DEBUG") else logging.WARNING,
+        format="%(message)s",
+    )
     try:
         if sys.platform == 'win32':
             # Set up proper event loop policy for Windows
             asyncio.set_event_loop_policy(asyncio.WindowsSelectorEventLoopPolicy())
+        enable_ansi_terminal()
         
         # Run the async main function
         asyncio.run(main())